@@ -1,14 +1,27 @@
 from __future__ import annotations
 
-import json
 import logging
+import os
 import warnings
-from dataclasses import asdict, astuple, dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, astuple, dataclass, fields
 from numbers import Number
 from pathlib import Path
-from typing import Iterator, List, Optional, Protocol, Sequence, runtime_checkable
-
-from pymeasuremap.utils import store_json, time_signature2nominal_length
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    runtime_checkable,
+)
+
+import numpy as np
+
+from pymeasuremap.utils import load_json, store_json, time_signature2nominal_length
 
 module_logger = logging.getLogger(__name__)
 
@@ -18,6 +31,8 @@ module_logger = logging.getLogger(__name__)
 
 @runtime_checkable
 class PMeasure(Protocol):
+    __slots__ = ()
+
     ID: str
     """Any unique string to identify this measure."""
     count: int
@@ -75,7 +90,7 @@ class PMeasure(Protocol):
         ...
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Measure(PMeasure):
     ID: Optional[str] = None
     count: Optional[int] = None
@@ -189,7 +204,10 @@ def make_default_successor(measure: Measure, ignore_ids: bool = False) -> Measur
         raise TypeError(
             f"measure must be a Measure, got {type(measure)!r}: {measure!r}"
         )
-    successor_values = asdict(measure)
+    # a shallow copy suffices because Measure.__post_init__() copies the 'next' list
+    successor_values = {
+        field_name: getattr(measure, field_name) for field_name in MEASURE_FIELDS
+    }
     if successor_values["qstamp"] is not None:
         # in order to compute the subsequent qstamp, we need to know the nominal length of the current measure
         try:
@@ -259,6 +277,16 @@ def make_default_successor(measure: Measure, ignore_ids: bool = False) -> Measur
     return successor
 
 
+MEASURE_FIELDS: Tuple[str, ...] = tuple(field.name for field in fields(Measure))
+NUMERICAL_MEASURE_FIELDS: Tuple[str, ...] = (
+    "count",
+    "qstamp",
+    "number",
+    "nominal_length",
+    "actual_length",
+)
+"""Fields that :meth:`MeasureMap.to_arrays` converts to float arrays."""
+
 # endregion Measure
 # region MeasureMap
 
@@ -311,6 +339,11 @@ class MeasureMap(PMeasureMap):
                 f"Subscript the MeasureMap with a valid count value (got {item!r}). To access the list "
                 f"of Measures, use the .entries property."
             )
+        # in a complete MeasureMap, the entry with count n is found at position n-1
+        if isinstance(item, int) and item <= len(self.entries):
+            candidate = self.entries[item - 1]
+            if candidate.count == item:
+                return candidate
         try:
             return next(entry for entry in self.entries if entry.count == item)
         except StopIteration:
@@ -323,8 +356,7 @@ class MeasureMap(PMeasureMap):
 
     @classmethod
     def from_json_file(cls, filepath: Path | str) -> MeasureMap:
-        with open(filepath, "r", encoding="utf-8") as f:
-            mm_json = json.load(f)
+        mm_json = load_json(filepath)
         return cls.from_dicts(mm_json)
 
     def compress(self, ignore_ids: bool = False) -> MeasureMap:
@@ -332,6 +364,18 @@ class MeasureMap(PMeasureMap):
         predecessors are omitted."""
         return compress_measure_map(self, ignore_ids=ignore_ids)
 
+    def default_successor_mask(self, ignore_ids: bool = False) -> np.ndarray:
+        """Returns a boolean array with one element less than there are entries, where element i is True if entry
+        i+1 is identical to <entry i>.get_default_successor() and can therefore be omitted when compressing.
+        """
+        return get_default_successor_mask(self, ignore_ids=ignore_ids)
+
+    def default_successor_deltas(self, ignore_ids: bool = False) -> np.ndarray:
+        """Returns an integer array with one element less than there are entries, where bit k of element i is set
+        if entry i+1 differs from <entry i>.get_default_successor() in the field MEASURE_FIELDS[k].
+        """
+        return get_default_successor_deltas(self, ignore_ids=ignore_ids)
+
     def iter_tuples(
         self,
         ID: bool = True,
@@ -369,6 +413,25 @@ class MeasureMap(PMeasureMap):
             else:
                 yield entry_tup
 
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Converts the MeasureMap into one array per Measure field. Numerical fields become float arrays in which
+        missing values are NaN, all other fields become object arrays in which missing values are None.
+        """
+        arrays = {}
+        for field_name in MEASURE_FIELDS:
+            values = [getattr(entry, field_name) for entry in self.entries]
+            if field_name in NUMERICAL_MEASURE_FIELDS:
+                arrays[field_name] = np.array(
+                    [np.nan if value is None else value for value in values],
+                    dtype=float,
+                )
+            else:
+                column = np.empty(len(values), dtype=object)
+                for i, value in enumerate(values):
+                    column[i] = value
+                arrays[field_name] = column
+        return arrays
+
     def to_dicts(
         self,
         verbose=False,
@@ -390,30 +453,253 @@ def compress_measure_map(
         raise TypeError(
             f"measure_map must be a MeasureMap, got {type(measure_map)!r}: {measure_map!r}"
         )
-    compressed_entries = []
-    previous_measure = None
-    for measure in measure_map:
-        if previous_measure is None:
-            previous_measure = measure
+    entries = measure_map.entries
+    deltas = measure_map.default_successor_deltas(ignore_ids=ignore_ids)
+    compressed_entries = [entries[0]]
+    log_details = module_logger.isEnabledFor(logging.DEBUG)
+    if log_details:
+        module_logger.debug("First entry maintained by default.")
+    for measure, delta in zip(entries[1:], deltas):
+        if delta:
             compressed_entries.append(measure)
-            module_logger.debug("First entry maintained by default.")
+        if not log_details:
             continue
-        default_successor = previous_measure.get_default_successor(
-            ignore_ids=ignore_ids
-        )
-        if measure == default_successor:
+        if not delta:
             module_logger.debug(
                 f"MC {measure.count} can be re-generated from its predecessor."
             )
-        else:
-            compressed_entries.append(measure)
-            module_logger.debug(
-                f"(2) MC {measure.count} differs from the (1) expected default successor:\n"
-                f"\t(1) {default_successor}\n"
-                f"\t(2) {measure}"
-            )
-        previous_measure = measure
+            continue
+        differing_fields = ", ".join(
+            field_name
+            for bit, field_name in enumerate(MEASURE_FIELDS)
+            if delta & (1 << bit)
+        )
+        module_logger.debug(
+            f"MC {measure.count} differs from the expected default successor in: {differing_fields}\n"
+            f"\t{measure}"
+        )
     return MeasureMap(compressed_entries)
 
 
+def load_measure_maps(filepaths: Iterable[Path | str]) -> List[MeasureMap]:
+    """Reads the given JSON files into MeasureMaps, using a thread pool so that reading the files overlaps."""
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return list(executor.map(MeasureMap.from_json_file, filepaths))
+
+
+def get_default_successor_mask(
+    measure_map: MeasureMap, ignore_ids: bool = False
+) -> np.ndarray:
+    """Vectorized equivalent of comparing every entry of a MeasureMap with <predecessor>.get_default_successor().
+
+    Args:
+        measure_map: The MeasureMap whose entries are to be compared with their predecessors' default successors.
+        ignore_ids: Same as for :meth:`Measure.get_default_successor`.
+
+    Returns:
+        Boolean array with one element less than there are entries, where element i is True if entry i+1 is
+        identical to the default successor of entry i and can therefore be omitted from a compressed MeasureMap.
+
+    Raises:
+        Whatever <predecessor>.get_default_successor() raises for the first entry whose default successor cannot
+        be computed.
+    """
+    return get_default_successor_deltas(measure_map, ignore_ids=ignore_ids) == 0
+
+
+def get_default_successor_deltas(
+    measure_map: MeasureMap, ignore_ids: bool = False
+) -> np.ndarray:
+    """Compares every entry of a MeasureMap with <predecessor>.get_default_successor() and encodes which fields
+    differ.
+
+    Default successors that can be derived from the columns returned by :meth:`MeasureMap.to_arrays` are computed
+    in a vectorized manner. For all other entries, e.g. those whose length would have to be derived from an invalid
+    time signature or whose numerical fields cannot be represented exactly as floats (such as Fractions),
+    <predecessor>.get_default_successor() is called, so that the results, exceptions, and warnings are the same as
+    when compressing entry by entry.
+
+    Args:
+        measure_map: The MeasureMap whose entries are to be compared with their predecessors' default successors.
+        ignore_ids: Same as for :meth:`Measure.get_default_successor`.
+
+    Returns:
+        Integer array with one element less than there are entries, where bit k of element i is set if entry i+1
+        differs from the default successor of entry i in the field MEASURE_FIELDS[k]. Zero therefore means that
+        entry i+1 can be omitted from a compressed MeasureMap.
+
+    Raises:
+        Whatever <predecessor>.get_default_successor() raises for the first entry whose default successor cannot
+        be computed.
+    """
+    if not isinstance(measure_map, MeasureMap):
+        raise TypeError(
+            f"measure_map must be a MeasureMap, got {type(measure_map)!r}: {measure_map!r}"
+        )
+    arrays = measure_map.to_arrays()
+    pred = {field_name: column[:-1] for field_name, column in arrays.items()}
+    succ = {field_name: column[1:] for field_name, column in arrays.items()}
+    count_missing = np.isnan(pred["count"])
+    number_missing = np.isnan(pred["number"])
+    actual_length_missing = np.isnan(pred["actual_length"])
+    nominal_length_missing = np.isnan(pred["nominal_length"])
+    # lengths are derived from the time signature only where get_default_successor() does so
+    needs_ts_length = (~np.isnan(pred["qstamp"]) & actual_length_missing) | (
+        ~actual_length_missing & nominal_length_missing
+    )
+    ts_lengths = _time_signatures2nominal_lengths(
+        pred["time_signature"], needs_ts_length
+    )
+    count = pred["count"] + 1
+    number = pred["number"] + 1
+    next_values, next_is_irregular = _make_default_next_values(
+        pred["next"], count, number
+    )
+    # entries for which the shortcut below does not apply are handled by get_default_successor()
+    irregular = needs_ts_length & ~(ts_lengths >= 0)  # NaN for invalid time signatures
+    irregular |= ~np.equal(pred["name"], None) & number_missing
+    irregular |= next_is_irregular
+    is_exact = np.fromiter(
+        (
+            all(
+                _is_exact_float(getattr(entry, field_name))
+                for field_name in NUMERICAL_MEASURE_FIELDS
+            )
+            for entry in measure_map.entries
+        ),
+        dtype=bool,
+        count=len(measure_map.entries),
+    )
+    irregular |= ~(is_exact[:-1] & is_exact[1:])
+    if ignore_ids:
+        irregular |= count_missing
+        ID = np.full(len(count), None, dtype=object)
+    else:
+        irregular |= ~np.equal(pred["ID"], None) & count_missing
+        ID = _replace_present(pred["ID"], _floats2strings(count))
+    pred_actual_length = np.where(
+        actual_length_missing, ts_lengths, pred["actual_length"]
+    )
+    pred_nominal_length = np.where(
+        nominal_length_missing, ts_lengths, pred["nominal_length"]
+    )
+    expected = dict(
+        ID=ID,
+        count=count,
+        qstamp=pred["qstamp"] + pred_actual_length,
+        number=number,
+        name=_replace_present(pred["name"], _floats2strings(number)),
+        time_signature=pred["time_signature"],
+        nominal_length=pred["nominal_length"],
+        actual_length=np.where(actual_length_missing, np.nan, pred_nominal_length),
+        start_repeat=_replace_present(pred["start_repeat"], False),
+        end_repeat=_replace_present(pred["end_repeat"], False),
+        next=next_values,
+    )
+    # the comparisons write into preallocated buffers to avoid allocating temporary arrays for every field
+    n = len(count)
+    deltas = np.zeros(n, dtype=np.uint32)
+    equal = np.empty(n, dtype=bool)
+    actual_missing = np.empty(n, dtype=bool)
+    expected_missing = np.empty(n, dtype=bool)
+    for bit, field_name in enumerate(MEASURE_FIELDS):
+        actual_column = succ[field_name]
+        expected_column = expected[field_name]
+        if field_name in NUMERICAL_MEASURE_FIELDS:
+            np.equal(actual_column, expected_column, out=equal)
+            np.isnan(actual_column, out=actual_missing)
+            np.isnan(expected_column, out=expected_missing)
+            np.logical_and(actual_missing, expected_missing, out=actual_missing)
+            np.logical_or(equal, actual_missing, out=equal)
+        else:
+            np.equal(actual_column, expected_column, out=equal)
+        np.logical_not(equal, out=equal)
+        np.bitwise_or(deltas, np.uint32(1 << bit), out=deltas, where=equal)
+    entries = measure_map.entries
+    for i in np.flatnonzero(irregular):
+        default_successor = entries[i].get_default_successor(ignore_ids=ignore_ids)
+        deltas[i] = _get_field_deltas(default_successor, entries[i + 1])
+    return deltas
+
+
+def _floats2strings(values: np.ndarray) -> np.ndarray:
+    """Turns a float array of integral values into an object array of strings such as '3', with None for NaN."""
+    strings = np.nan_to_num(values).astype(np.int64).astype(str).astype(object)
+    strings[np.isnan(values)] = None
+    return strings
+
+
+def _get_field_deltas(measure: Measure, other: Measure) -> int:
+    """Returns an integer where bit k is set if the two Measures differ in the field MEASURE_FIELDS[k]."""
+    return sum(
+        1 << bit
+        for bit, field_name in enumerate(MEASURE_FIELDS)
+        if getattr(measure, field_name) != getattr(other, field_name)
+    )
+
+
+def _is_exact_float(value) -> bool:
+    """Returns True if the value of a numerical Measure field is missing or converted to a float by
+    :meth:`MeasureMap.to_arrays` without loss, i.e. if it is a float or an int whose absolute value does not
+    exceed 2**53.
+    """
+    if value is None or type(value) is float:
+        return True
+    return type(value) is int and -(2**53) <= value <= 2**53
+
+
+def _make_default_next_values(
+    next_values: np.ndarray,
+    successor_counts: np.ndarray,
+    successor_numbers: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Computes the 'next' field of the default successors in the same way as :func:`make_default_successor`.
+    Since the values are lists of varying length, this is done in a loop.
+
+    Returns:
+        The 'next' values and a boolean array that is True where they have been left empty because
+        :func:`make_default_successor` would warn or fail, i.e. for empty lists and for lists whose first item
+        cannot be incremented.
+    """
+    result = np.full(len(next_values), None, dtype=object)
+    is_irregular = np.zeros(len(next_values), dtype=bool)
+    for i, (next_value, count, number) in enumerate(
+        zip(next_values, successor_counts, successor_numbers)
+    ):
+        if next_value is None:
+            continue
+        if next_value:
+            old_next_value = next_value[0]
+            if isinstance(old_next_value, int) and not np.isnan(count):
+                result[i] = [int(count) + 1]
+                continue
+            if isinstance(old_next_value, str) and not np.isnan(number):
+                result[i] = [str(int(number) + 1)]
+                continue
+        is_irregular[i] = True
+    return result, is_irregular
+
+
+def _replace_present(column: np.ndarray, replacement) -> np.ndarray:
+    """Returns an object array in which all values of ``column`` that are not None are replaced by ``replacement``."""
+    return np.where(np.equal(column, None), None, replacement).astype(object)
+
+
+def _time_signatures2nominal_lengths(
+    time_signatures: np.ndarray, where: np.ndarray
+) -> np.ndarray:
+    """Vectorized version of :func:`time_signature2nominal_length` that converts only the time signatures selected
+    by the boolean array ``where``. Returns NaN for all others and for time signatures that cannot be converted.
+    """
+    lengths = np.full(len(time_signatures), np.nan)
+    for time_signature in set(time_signatures[where]):
+        try:
+            length = time_signature2nominal_length(time_signature)
+        # re-raised by get_default_successor() for the affected entries
+        except (AssertionError, OverflowError, ValueError, ZeroDivisionError):
+            continue
+        lengths[where & (time_signatures == time_signature)] = length
+    return lengths
+
+
 # endregion MeasureMap
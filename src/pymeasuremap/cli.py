@@ -45,6 +45,7 @@ def extract_cmd(args):
         file_regex=args.regex,
         extensions=args.extensions,
         measure_map_extension=args.mm_extension,
+        max_workers=args.max_workers,
     )
 
 
@@ -151,6 +152,12 @@ The library offers you the following commands. Add the flag -h to one of them to
         "--mm-extension",
         default=".mm.json",
     )
+    extract_parser.add_argument(
+        "--max-workers",
+        type=int,
+        help="Number of processes used for extracting. Defaults to the number of CPUs, pass 1 to disable "
+        "multiprocessing.",
+    )
     extract_parser.set_defaults(func=extract_cmd)
 
     return parser
@@ -1,10 +1,10 @@
 """Comparing MeasureMaps pertaining two the same music."""
-import json
 import logging
 from pathlib import Path
 from typing import Optional
 
 from pymeasuremap.base import MeasureMap
+from pymeasuremap.utils import load_json
 
 module_logger = logging.getLogger(__name__)
 
@@ -605,10 +605,8 @@ def write_diagnosis(
 
 
 def one_comparison(preferred_path: Path, other_path: Path, write: bool = True) -> list:
-    with open(preferred_path, "r") as file:
-        preferred = json.load(file)
-    with open(other_path, "r") as file:
-        other = json.load(file)
+    preferred = load_json(preferred_path)
+    other = load_json(other_path)
     diagnosis = Compare(preferred, other).diagnosis
 
     if write:
@@ -1,8 +1,11 @@
 """Generate MeasureMaps from scores and annotation files."""
 import logging
+import os
 import warnings
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Iterable, List, Optional, Tuple
 
 from music21 import bar, converter, stream
 
@@ -27,62 +30,96 @@ def m21_part_to_measure_map(this_part: stream.Part) -> MeasureMap:
         "next": lst of str
     """
 
+    return _measure_properties2measure_map(_get_part_properties(this_part))
+
+
+def _get_measure_properties(measure: stream.Measure, time_sig: str) -> tuple:
+    """Collects the values of a measure that a MeasureMap entry is built from, namely offset, measure number, time
+    signature (``time_sig`` if the measure does not change it), nominal length, actual length, whether the left
+    barline is of type "regular", start repeat, and end repeat.
+    """
+    # music21 computes some of these attributes on access, so each is looked up only once
+    left_barline = measure.leftBarline
+    right_barline = measure.rightBarline
+    time_signature = measure.timeSignature
+    if time_signature:
+        time_sig = time_signature.ratioString
+    return (
+        measure.offset,
+        measure.measureNumber,
+        time_sig,
+        measure.barDuration.quarterLength,
+        measure.duration.quarterLength,
+        left_barline is not None and left_barline.type == "regular",
+        isinstance(left_barline, bar.Repeat) and left_barline.direction == "start",
+        isinstance(right_barline, bar.Repeat) and right_barline.direction == "end",
+    )
+
+
+def _get_part_properties(this_part: stream.Part) -> List[tuple]:
+    """Returns the :func:`_get_measure_properties` of all measures in the part. Parts whose properties are equal
+    result in the same MeasureMap.
+    """
+    measures = list(this_part.recurse().getElementsByClass(stream.Measure))
+    time_sig = measures[0].timeSignature.ratioString
+    part_properties = []
+    for measure in measures:
+        measure_properties = _get_measure_properties(measure, time_sig)
+        time_sig = measure_properties[2]
+        part_properties.append(measure_properties)
+    return part_properties
+
+
+def _measure_properties2measure_map(part_properties: List[tuple]) -> MeasureMap:
+    """Builds the MeasureMap described in :func:`m21_part_to_measure_map` from :func:`_get_part_properties`."""
+    n_measures = len(part_properties)
     sheet_measure_map = []
     go_back_to = 1
     go_forward_from = 1
-    time_sig = this_part.getElementsByClass(stream.Measure)[0].timeSignature.ratioString
-    count = 1
 
-    for measure in this_part.recurse().getElementsByClass(stream.Measure):
-        end_repeat = False
-        start_repeat = False
+    for count, (
+        qstamp,
+        number,
+        time_sig,
+        nominal_length,
+        actual_length,
+        regular_left_barline,
+        start_repeat,
+        end_repeat,
+    ) in enumerate(part_properties, start=1):
         next = []
 
-        if measure.timeSignature:
-            time_sig = measure.timeSignature.ratioString
-
-        if measure.leftBarline:  # TODO: Replace with normal equality checks
-            if str(measure.leftBarline) == str(bar.Repeat(direction="start")):
-                start_repeat = True
-        if measure.rightBarline:
-            if str(measure.rightBarline) == str(bar.Repeat(direction="end")):
-                end_repeat = True
-
         if (
             start_repeat
         ):  # Crude method to add next measure information including for multiple endings from repeats
             go_back_to = count
-        elif measure.leftBarline:
-            if (
-                measure.leftBarline.type == "regular"
-                and sheet_measure_map[count - 2]["end_repeat"]
-            ):
+        elif regular_left_barline:
+            if sheet_measure_map[count - 2]["end_repeat"]:
                 sheet_measure_map[go_forward_from - 1]["next"].append(count)
-            elif measure.leftBarline.type == "regular":
+            else:
                 go_forward_from = count - 1
         if end_repeat:
             next.append(go_back_to)
-        if count + 1 <= len(
-            this_part.recurse().getElementsByClass(stream.Measure)
-        ) and not (end_repeat and count > go_forward_from != 1):
+        if count + 1 <= n_measures and not (
+            end_repeat and count > go_forward_from != 1
+        ):
             next.append(count + 1)
 
         measure_dict = {
             # ID
             "count": count,
-            "qstamp": measure.offset,
-            "number": measure.measureNumber,
+            "qstamp": qstamp,
+            "number": number,
             # "name"
             "time_signature": time_sig,
-            "nominal_length": measure.barDuration.quarterLength,
-            "actual_length": measure.duration.quarterLength,
+            "nominal_length": nominal_length,
+            "actual_length": actual_length,
             "start_repeat": start_repeat,
             "end_repeat": end_repeat,
             "next": next,
         }
 
         sheet_measure_map.append(measure_dict)
-        count += 1
 
     return MeasureMap.from_dicts(sheet_measure_map)
 
@@ -106,7 +143,8 @@ def m21_stream_to_measure_map(
     if not isinstance(this_stream, stream.Score):
         raise ValueError("Only accepts a stream.Part or stream.Score")
 
-    measure_map = m21_part_to_measure_map(this_stream.parts[0])
+    part_properties = _get_part_properties(this_stream.parts[0])
+    measure_map = _measure_properties2measure_map(part_properties)
 
     if not check_parts_match:
         return measure_map
@@ -117,8 +155,7 @@ def m21_stream_to_measure_map(
         return measure_map
 
     for part in range(1, num_parts):
-        part_measure_map = m21_part_to_measure_map(this_stream.parts[part])
-        if part_measure_map != measure_map:
+        if _get_part_properties(this_stream.parts[part]) != part_properties:
             raise ValueError(f"Parts 0 and {part} do not match.")
 
     return measure_map
@@ -144,7 +181,16 @@ def extract_directory(
     file_regex: str = "*",
     extensions: Optional[str | Iterable[str]] = None,
     measure_map_extension: str = ".mm.json",
+    max_workers: Optional[int] = None,
 ):
+    """Extracts a MeasureMap from every score under ``directory`` and writes it next to the score or into the
+    corresponding subfolder of ``output_directory``.
+
+    Args:
+        max_workers:
+            Number of processes used for parsing the scores, defaults to the number of CPUs. Pass 1 to process all
+            files in the current process, e.g. for debugging.
+    """
     directory = resolve_dir(directory)
     if output_directory is not None:
         output_directory = resolve_dir(output_directory)
@@ -152,37 +198,83 @@ def extract_directory(
         extensions = get_m21_input_extensions()
     elif isinstance(extensions, str):
         extensions = [extensions]
+    suffixes = frozenset(
+        ext if ext.startswith(".") else f".{ext}" for ext in extensions
+    )
+    multi_dot_suffixes = tuple(ext for ext in suffixes if ext.count(".") > 1)
     paths = directory.rglob(file_regex)
     module_logger.info(
         f"Iterating through paths within {directory} that match the regex {file_regex!r} and have one "
         f"of these extensions: {extensions!r}"
     )
+    log_skipped = module_logger.isEnabledFor(logging.DEBUG)
+    filepaths = []
     for filepath in paths:
-        if not any(filepath.name.endswith(ext) for ext in extensions):
-            module_logger.debug(
-                f"Skipping {filepath}: Extension {filepath.suffix} not in {extensions}"
-            )
+        suffix = filepath.suffix
+        if suffix not in suffixes and not (
+            multi_dot_suffixes and filepath.name.endswith(multi_dot_suffixes)
+        ):
+            if log_skipped:
+                module_logger.debug(
+                    f"Skipping {filepath}: Extension {suffix} not in {extensions}"
+                )
             continue
-        try:
-            mm = m21_filepath_to_measure_map(filepath)
-        except Exception as e:
+        filepaths.append(filepath)
+    extract_file = partial(
+        _extract_file,
+        directory=directory,
+        output_directory=output_directory,
+        measure_map_extension=measure_map_extension,
+    )
+    if max_workers is None:
+        max_workers = os.cpu_count()
+    if max_workers == 1:
+        _log_extraction_results(filepaths, map(extract_file, filepaths))
+        return
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(extract_file, filepaths, chunksize=4)
+        _log_extraction_results(filepaths, results)
+
+
+def _log_extraction_results(
+    filepaths: Iterable[Path],
+    results: Iterable[Tuple[Optional[Path], Optional[str]]],
+):
+    """Logs the results of :func:`_extract_file` for the given input files."""
+    for filepath, (output_filepath, error) in zip(filepaths, results):
+        if error is not None:
             module_logger.warning(
-                f"Extracting MeasureMap from {filepath} failed with\n{e!r}"
+                f"Extracting MeasureMap from {filepath} failed with\n{error}"
             )
             continue
-
-        input_folder = filepath.parent
-        if output_directory is None:
-            output_folder = input_folder
-        else:
-            output_folder = output_directory / input_folder.relative_to(directory)
-        output_filepath = make_measure_map_filepath(
-            filepath, measure_map_extension, output_folder
-        )
-        mm.to_json_file(output_filepath)
         module_logger.info(f"Extracted MeasureMap {output_filepath} from {filepath}.")
 
 
+def _extract_file(
+    filepath: Path,
+    directory: Path,
+    output_directory: Optional[Path],
+    measure_map_extension: str,
+) -> Tuple[Optional[Path], Optional[str]]:
+    """Worker used by :func:`extract_directory` to process a single file in a separate process. Returns the path of
+    the written MeasureMap and None, or None and the repr of the exception that made the extraction fail.
+    """
+    try:
+        mm = m21_filepath_to_measure_map(filepath)
+    except Exception as e:
+        return None, repr(e)
+    input_folder = filepath.parent
+    if output_directory is None:
+        output_folder = input_folder
+    else:
+        output_folder = output_directory / input_folder.relative_to(directory)
+    output_filepath = make_measure_map_filepath(
+        filepath, measure_map_extension, output_folder
+    )
+    mm.to_json_file(output_filepath)
+    return output_filepath, None
+
+
 def make_measure_map_filepath(
     filepath: Path,
     measure_map_extension: str = ".mm.json",
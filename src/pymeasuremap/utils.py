@@ -3,33 +3,58 @@ from __future__ import annotations
 import json
 import os
 from fractions import Fraction
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
 
 from music21 import converter
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 
 def collect_measure_maps(directory: Path | str) -> List[str]:
-    """Returns all filepaths under the given directory that end with '.measuremap.json'."""
+    """Returns all filepaths under the given directory that end with '.mm.json', skipping hidden folders."""
+    return list(iter_measure_maps(directory))
+
+
+def iter_measure_maps(directory: Path | str) -> Iterator[str]:
+    """Lazily yields all filepaths under the given directory that end with '.mm.json', skipping hidden folders.
+    Like :func:`os.walk`, folders that cannot be listed are skipped silently.
+    """
     directory = os.path.abspath(os.path.expanduser(directory))
-    filepaths = []
-    for folder, subfolders, filenames in os.walk(directory):
-        subfolders[:] = [s for s in subfolders if not s.startswith(".")]
-        for filename in filenames:
-            if filename.endswith(".mm.json"):
-                filepaths.append(os.path.join(directory, folder, filename))
-    return filepaths
+    subfolders = []
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if not entry.name.startswith("."):
+                    subfolders.append(entry.path)
+            elif entry.name.endswith(".mm.json"):
+                yield entry.path
+    for subfolder in subfolders:
+        yield from iter_measure_maps(subfolder)
 
 
+@lru_cache(maxsize=1)
 def get_m21_input_extensions() -> Tuple[str, ...]:
-    """Returns all file extensions that music21 can parse."""
+    """Returns all file extensions that music21 can parse. The result is cached because collecting it requires
+    walking music21's registry of sub-converters."""
     ext2converter = converter.Converter.getSubConverterFormats()
     extensions = list(ext2converter.keys()) + [".mxl", ".krn"]
     return tuple(ext if ext[0] == "." else f".{ext}" for ext in extensions)
 
 
+@lru_cache(maxsize=256)
 def time_signature2nominal_length(time_signature: str) -> float:
-    """Converts the given time signature into a fraction and then into the corresponding length in quarter notes."""
+    """Converts the given time signature into a fraction and then into the corresponding length in quarter notes.
+    Results are cached because a piece typically uses only a handful of distinct time signatures.
+    """
     assert isinstance(time_signature, str), (
         f"time_signature must be a string, got {type(time_signature)!r}: "
         f"{time_signature!r}"
@@ -41,6 +66,21 @@ def time_signature2nominal_length(time_signature: str) -> float:
     return ts_frac * 4.0
 
 
+def load_json(filepath: Path | str) -> dict | list:
+    """Deserialize the given JSON file, using orjson if it is installed. Files that orjson rejects but the json
+    module accepts, e.g. those containing NaN written by :func:`store_json`, are parsed with the json module.
+    """
+    if orjson is not None:
+        with open(filepath, "rb") as f:
+            content = f.read()
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return json.loads(content)
+    with open(filepath, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
 def resolve_dir(d: Path | str) -> Path:
     """Resolves '~' to HOME directory and turns ``d`` into an absolute path."""
     if d is None:
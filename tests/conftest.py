@@ -14,6 +14,7 @@ from typing import Dict
 import pytest
 from git import Repo
 
+from pymeasuremap.base import MeasureMap, load_measure_maps
 from pymeasuremap.utils import collect_measure_maps
 
 REPOSITORY_PATH = "~"
@@ -61,3 +62,10 @@ def get_mm_paths_ids():
 @pytest.fixture(scope="session", params=get_mm_paths_params(), ids=get_mm_paths_ids())
 def single_mm_path(request) -> Path:
     return request.param
+
+
+@pytest.fixture(scope="session")
+def measure_maps() -> Dict[Path, MeasureMap]:
+    """All parsed MeasureMaps by path, loaded once per session and shared by the tests parametrized over them."""
+    paths = get_mm_paths_params()
+    return dict(zip(paths, load_measure_maps(paths)))
@@ -1,23 +1,247 @@
+import logging
+import os
+import re
 from difflib import unified_diff
+from fractions import Fraction
+from pathlib import Path
 
-from pymeasuremap.base import MeasureMap
+import numpy as np
+import pytest
 
+from pymeasuremap.base import MEASURE_FIELDS, Measure, MeasureMap
 
-def test_compression(single_mm_path):
-    MM = MeasureMap.from_json_file(single_mm_path)
+REPORT_TEMPLATE = "MC {count:.0f} differs from the default successor of MC {previous_count:.0f} in: {fields}"
+
+
+def test_compression(single_mm_path, measure_maps):
+    MM = measure_maps[single_mm_path]
+    deltas = MM.default_successor_deltas()
+    if os.environ.get("PYMM_VERBOSE"):
+        counts = MM.to_arrays()["count"]
+        report = "\n".join(
+            REPORT_TEMPLATE.format(
+                count=counts[i + 1],
+                previous_count=counts[i],
+                fields=", ".join(
+                    field_name
+                    for bit, field_name in enumerate(MEASURE_FIELDS)
+                    if deltas[i] & (1 << bit)
+                ),
+            )
+            for i in np.flatnonzero(deltas)
+        )
+        print(report)
     compressed = MM.compress()
     assert len(compressed.entries) < len(MM.entries)
+    assert compressed.entries == MM.entries[:1] + [
+        measure
+        for previous_measure, measure in zip(MM.entries, MM.entries[1:])
+        if previous_measure.get_default_successor() != measure
+    ]
+
+
+def test_default_successor_mask(single_mm_path, measure_maps):
+    MM = measure_maps[single_mm_path]
+    expected = [
+        previous_measure.get_default_successor() == measure
+        for previous_measure, measure in zip(MM.entries, MM.entries[1:])
+    ]
+    assert MM.default_successor_mask().tolist() == expected
+
+
+SYNTHETIC_MEASURE_MAPS = {
+    "regular": [
+        dict(ID="1", count=1, qstamp=0, number=1, name="1", time_signature="3/4"),
+        dict(ID="2", count=2, qstamp=3.0, number=2, name="2", time_signature="3/4"),
+        dict(ID="x", count=3, qstamp=6.0, number=3, name="3", time_signature="3/4"),
+    ],
+    "missing_fields": [
+        dict(count=1, number=1),
+        dict(count=2, number=2),
+        dict(count=3, qstamp=0.0, number=3),
+    ],
+    "string_next": [
+        dict(count=1, number=1, next=["2"]),
+        dict(count=2, number=2, next=["3"]),
+        dict(count=3, number=3, next=[4]),
+    ],
+    "lengths_without_time_signature": [
+        dict(count=1, qstamp=0, nominal_length=4.0, actual_length=1.0),
+        dict(count=2, qstamp=1.0, nominal_length=4.0, actual_length=4.0),
+        dict(count=3, qstamp=5.0, nominal_length=4.0, actual_length=4.0),
+    ],
+    "fractions": [
+        dict(
+            count=count,
+            qstamp=Fraction(count - 1, 3),
+            nominal_length=Fraction(1, 3),
+            actual_length=Fraction(1, 3),
+        )
+        for count in (1, 2, 3)
+    ],
+    "large_counts": [dict(count=2**60 + 1), dict(count=2**60 + 3)],
+    "unparsable_time_signature_with_lengths": [
+        dict(
+            count=1,
+            qstamp=0,
+            time_signature="3/0",
+            nominal_length=3.0,
+            actual_length=3.0,
+        ),
+        dict(
+            count=2,
+            qstamp=3.0,
+            time_signature="3/0",
+            nominal_length=3.0,
+            actual_length=3.0,
+        ),
+    ],
+}
+
+INVALID_MEASURE_MAPS = [
+    pytest.param(
+        [dict(count=1, qstamp=0), dict(count=2)],
+        False,
+        AssertionError,
+        "time_signature must be a string",
+        id="missing_time_signature",
+    ),
+    pytest.param(
+        [
+            dict(count=1, qstamp=0, time_signature="C"),
+            dict(count=2, qstamp=4.0, time_signature="C"),
+        ],
+        False,
+        ValueError,
+        "Cannot compute the successor's 'qstamp'",
+        id="unparsable_time_signature",
+    ),
+    pytest.param(
+        [dict(ID="1"), dict(ID="2")],
+        False,
+        ValueError,
+        "Cannot compute default ID because 'count' is not specified.",
+        id="ID_without_count",
+    ),
+    pytest.param(
+        [dict(ID="1"), dict(ID="2")],
+        True,
+        ValueError,
+        "Either ID or count must be set",
+        id="ignored_ID_without_count",
+    ),
+    pytest.param(
+        [dict(count=1, name="1"), dict(count=2, name="2")],
+        False,
+        AssertionError,
+        "Cannot created default 'name' field because 'number' is not specified.",
+        id="name_without_number",
+    ),
+    pytest.param(
+        [dict(ID="a", next=[2]), dict(ID="b")],
+        True,
+        AssertionError,
+        "Cannot created default 'next' field with integers because 'count' is not specified.",
+        id="int_next_without_count",
+    ),
+]
+
+
+def get_expected_deltas(measure_map, ignore_ids):
+    expected = []
+    for previous_measure, measure in zip(measure_map.entries, measure_map.entries[1:]):
+        default_successor = previous_measure.get_default_successor(
+            ignore_ids=ignore_ids
+        )
+        expected.append(
+            sum(
+                1 << bit
+                for bit, field_name in enumerate(MEASURE_FIELDS)
+                if getattr(default_successor, field_name)
+                != getattr(measure, field_name)
+            )
+        )
+    return expected
 
 
-def test_json_output(single_mm_path, tmp_path):
-    mm = MeasureMap.from_json_file(single_mm_path)
+@pytest.mark.parametrize("ignore_ids", [False, True])
+@pytest.mark.parametrize("name", SYNTHETIC_MEASURE_MAPS)
+def test_synthetic_default_successor_deltas(name, ignore_ids):
+    MM = MeasureMap([Measure(**entry) for entry in SYNTHETIC_MEASURE_MAPS[name]])
+    expected = get_expected_deltas(MM, ignore_ids)
+    assert MM.default_successor_deltas(ignore_ids=ignore_ids).tolist() == expected
+    assert MM.default_successor_mask(ignore_ids=ignore_ids).tolist() == [
+        delta == 0 for delta in expected
+    ]
+
+
+@pytest.mark.parametrize(
+    "entries, ignore_ids, exception_type, message", INVALID_MEASURE_MAPS
+)
+def test_synthetic_default_successor_errors(
+    entries, ignore_ids, exception_type, message
+):
+    """The vectorized comparison raises the same exceptions as the comparison entry by entry."""
+    MM = MeasureMap([Measure(**entry) for entry in entries])
+    with pytest.raises(exception_type, match=re.escape(message)):
+        MM.entries[0].get_default_successor(ignore_ids=ignore_ids)
+    with pytest.raises(exception_type, match=re.escape(message)):
+        MM.default_successor_deltas(ignore_ids=ignore_ids)
+
+
+@pytest.mark.parametrize("ignore_ids", [False, True])
+def test_synthetic_default_successor_empty_next(ignore_ids):
+    MM = MeasureMap([Measure(count=1, next=[]), Measure(count=2)])
+    with pytest.warns(UserWarning, match="'next' field containing an empty list"):
+        deltas = MM.default_successor_deltas(ignore_ids=ignore_ids)
+    assert deltas.tolist() == [1 << MEASURE_FIELDS.index("next")]
+
+
+@pytest.mark.parametrize("level", [logging.INFO, logging.DEBUG])
+def test_compression_independent_of_log_level(level, caplog):
+    caplog.set_level(level, logger="pymeasuremap.base")
+    MM = MeasureMap(
+        [
+            Measure(count=count, qstamp=4.0 * (count - 1), time_signature="C")
+            for count in (1, 2, 3)
+        ]
+    )
+    with pytest.raises(ValueError, match="Cannot compute the successor's 'qstamp'"):
+        MM.compress()
+    MM = MeasureMap([Measure(**entry) for entry in SYNTHETIC_MEASURE_MAPS["regular"]])
+    assert MM.compress().entries == [MM.entries[0], MM.entries[2]]
+
+
+def test_getitem():
+    MM = MeasureMap([Measure(**entry) for entry in SYNTHETIC_MEASURE_MAPS["regular"]])
+    assert MM[2] is MM.entries[1]
+    assert MM[2.0] is MM.entries[1]
+    MM = MeasureMap([Measure(count=count) for count in (1, 3, 4)])
+    assert MM[3] is MM.entries[1]
+    with pytest.raises(IndexError):
+        MM[2]
+
+
+@pytest.mark.parametrize("ignore_ids", [False, True])
+def test_default_successor_deltas(single_mm_path, measure_maps, ignore_ids):
+    MM = measure_maps[single_mm_path]
+    expected = get_expected_deltas(MM, ignore_ids)
+    assert MM.default_successor_deltas(ignore_ids=ignore_ids).tolist() == expected
+
+
+def test_json_output(single_mm_path, measure_maps, tmp_path):
+    mm = measure_maps[single_mm_path]
     tmp_filepath = tmp_path / "temp.mm.json"
     mm.to_json_file(tmp_filepath)
-    with open(single_mm_path, "r") as f1, open(tmp_filepath, "r") as f2:
-        text1_lines, text2_lines = f1.readlines(), f2.readlines()
-        diff = unified_diff(text1_lines, text2_lines, lineterm="")
-        diff_str = "".join(diff)
-        print(
-            f"Comparing original {single_mm_path} with {tmp_filepath}:\n\n{diff_str}..."
+    original_bytes = Path(single_mm_path).read_bytes()
+    output_bytes = tmp_filepath.read_bytes()
+    if original_bytes != output_bytes:
+        diff = unified_diff(
+            original_bytes.decode("utf-8").splitlines(),
+            output_bytes.decode("utf-8").splitlines(),
+            lineterm="",
+        )
+        diff_str = "\n".join(diff)
+        pytest.fail(
+            f"Comparing original {single_mm_path} with {tmp_filepath}:\n\n{diff_str}"
         )
-        assert diff_str == ""
@@ -0,0 +1,92 @@
+import logging
+
+import pytest
+from music21 import bar, meter, note, stream
+
+from pymeasuremap.base import MeasureMap
+from pymeasuremap.extract import (
+    _extract_file,
+    extract_directory,
+    m21_part_to_measure_map,
+    m21_stream_to_measure_map,
+)
+
+
+def make_score(n_measures: int = 3) -> stream.Score:
+    score = stream.Score()
+    for _ in range(2):
+        part = stream.Part()
+        for number in range(1, n_measures + 1):
+            measure = stream.Measure(number=number)
+            if number == 1:
+                measure.append(meter.TimeSignature("3/4"))
+            measure.append(note.Note("C4", quarterLength=3.0))
+            part.append(measure)
+        score.append(part)
+    return score
+
+
+def test_extract_file(tmp_path):
+    score_path = tmp_path / "score.musicxml"
+    make_score().write("musicxml", fp=score_path)
+    output_filepath, error = _extract_file(score_path, tmp_path, None, ".mm.json")
+    assert error is None
+    assert output_filepath == tmp_path / "score.mm.json"
+    mm = MeasureMap.from_json_file(output_filepath)
+    assert [measure.qstamp for measure in mm] == [0.0, 3.0, 6.0]
+
+
+def test_extract_file_failure(tmp_path):
+    broken_path = tmp_path / "broken.musicxml"
+    broken_path.write_text("this is not MusicXML")
+    output_filepath, error = _extract_file(broken_path, tmp_path, None, ".mm.json")
+    assert output_filepath is None
+    assert isinstance(error, str)
+    assert not (tmp_path / "broken.mm.json").exists()
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_extract_directory(tmp_path, caplog, max_workers):
+    input_dir = tmp_path / "scores"
+    (input_dir / "sub").mkdir(parents=True)
+    make_score().write("musicxml", fp=input_dir / "sub" / "score.musicxml")
+    make_score(n_measures=4).write("musicxml", fp=input_dir / "other.musicxml")
+    (input_dir / "broken.musicxml").write_text("this is not MusicXML")
+    output_dir = tmp_path / "output"
+    with caplog.at_level(logging.INFO, logger="pymeasuremap.extract"):
+        extract_directory(
+            input_dir, output_dir, extensions=".musicxml", max_workers=max_workers
+        )
+    assert len(MeasureMap.from_json_file(output_dir / "sub" / "score.mm.json")) == 3
+    assert len(MeasureMap.from_json_file(output_dir / "other.mm.json")) == 4
+    assert not (output_dir / "broken.mm.json").exists()
+    assert any(
+        "broken.musicxml failed" in record.getMessage()
+        for record in caplog.records
+        if record.levelno == logging.WARNING
+    )
+
+
+def test_parts_differing_in_left_barline():
+    score = make_score()
+    for part in score.parts:
+        part.getElementsByClass(stream.Measure)[1].rightBarline = bar.Repeat(
+            direction="end"
+        )
+    score.parts[1].getElementsByClass(stream.Measure)[2].leftBarline = bar.Barline(
+        "regular"
+    )
+    measure_maps = [m21_part_to_measure_map(part) for part in score.parts]
+    assert measure_maps[0].entries != measure_maps[1].entries
+    with pytest.raises(ValueError, match="Parts 0 and 1 do not match."):
+        m21_stream_to_measure_map(score)
+
+
+def test_parts_differing_in_left_barline_style():
+    score = make_score()
+    score.parts[1].getElementsByClass(stream.Measure)[2].leftBarline = bar.Barline(
+        "dashed"
+    )
+    measure_maps = [m21_part_to_measure_map(part) for part in score.parts]
+    assert measure_maps[0].entries == measure_maps[1].entries
+    assert m21_stream_to_measure_map(score).entries == measure_maps[0].entries
@@ -0,0 +1,64 @@
+import json
+import os
+
+from pymeasuremap.base import Measure, MeasureMap
+from pymeasuremap.utils import collect_measure_maps, load_json, store_json
+
+
+def test_collect_measure_maps(tmp_path):
+    for folder in ("a/b", ".hidden"):
+        (tmp_path / folder).mkdir(parents=True)
+    for filepath in (
+        "x.mm.json",
+        "a/y.mm.json",
+        "a/b/z.mm.json",
+        ".hidden/h.mm.json",
+        "a/other.json",
+    ):
+        (tmp_path / filepath).touch()
+    assert collect_measure_maps(tmp_path) == [
+        str(tmp_path / "x.mm.json"),
+        str(tmp_path / "a" / "y.mm.json"),
+        str(tmp_path / "a" / "b" / "z.mm.json"),
+    ]
+
+
+def test_collect_measure_maps_skips_unreadable_folders(tmp_path, monkeypatch):
+    assert collect_measure_maps(tmp_path / "nonexistent") == []
+    locked = tmp_path / "locked"
+    locked.mkdir()
+    (locked / "x.mm.json").touch()
+    (tmp_path / "y.mm.json").touch()
+    scandir = os.scandir
+
+    def scandir_denying_locked(path):
+        if path == str(locked):
+            raise PermissionError(path)
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", scandir_denying_locked)
+    assert collect_measure_maps(tmp_path) == [str(tmp_path / "y.mm.json")]
+
+
+def test_store_json_output(tmp_path):
+    data = [{"name": "Ä1", "qstamp": float("nan"), "actual_length": 1e16}]
+    filepath = tmp_path / "out.json"
+    store_json(data, filepath)
+    assert filepath.read_text(encoding="utf-8") == json.dumps(data, indent=2)
+
+
+def test_non_ascii_round_trip(tmp_path):
+    mm = MeasureMap(
+        [Measure(count=1, name="Ä1"), Measure(count=2, name="Ä2")],
+    )
+    filepath = tmp_path / "temp.mm.json"
+    mm.to_json_file(filepath)
+    assert filepath.read_text(encoding="utf-8") == json.dumps(mm.to_dicts(), indent=2)
+    assert MeasureMap.from_json_file(filepath) == mm
+
+
+def test_load_json_accepts_stdlib_output(tmp_path):
+    data = [{"qstamp": float("inf"), "name": "Ä1", "count": 2**70}]
+    filepath = tmp_path / "out.json"
+    store_json(data, filepath)
+    assert load_json(filepath) == data